@@ -117,7 +117,7 @@ class CG_Compound(Compound):
                 # to be set correctly.
                 with tempfile.NamedTemporaryFile() as f:
                     mol.write(format="mol2", filename=f.name, overwrite=True)
-                    mol = list(pybel.readfile("mol2", f.name))[0]
+                    mol = next(pybel.readfile("mol2", f.name))
 
                 mol.OBMol.AddHydrogens()  # mol.addh()
                 n_atoms2 = mol.OBMol.NumAtoms()
@@ -143,23 +143,24 @@ class CG_Compound(Compound):
 
     def _set_mapping(self, beads, mol, allow_overlap):
         """Set the mapping attribute."""
-        particle_ids = np.array([id(p) for p in self.atomistic.particles()])
+        # Indexing a Compound lists all of its particles, so do it once
+        particles = list(self.atomistic.particles())
+        particle_ids = {id(p): i for i, p in enumerate(particles)}
+        hydrogen = ele.element_from_symbol("H")
         matches = []
         for bead_name, smart_str in beads.items():
             smarts = pybel.Smarts(smart_str)
-            if not smarts.findall(mol):
+            smarts_matches = smarts.findall(mol)
+            if not smarts_matches:
                 warn(f"{smart_str} not found in compound!")
-            for group in smarts.findall(mol):
+            for group in smarts_matches:
                 # correct for SMARTS one-based indexing
                 group = tuple(i - 1 for i in group)
                 _group = list(group)
                 for p_idx in group:
-                    for particle in self.atomistic[p_idx].direct_bonds():
-                        if particle.element == ele.element_from_symbol("H"):
-                            h_idx = int(
-                                np.where(particle_ids == id(particle))[0][0]
-                            )
-                            _group.append(h_idx)
+                    for particle in particles[p_idx].direct_bonds():
+                        if particle.element == hydrogen:
+                            _group.append(particle_ids[id(particle)])
                 group = tuple(_group)
                 matches.append((group, smart_str, bead_name))
 
@@ -196,17 +197,21 @@ class CG_Compound(Compound):
     def _cg_particles(self):
         """Set the beads in the coarse-structure."""
         orientations = []
+        # Indexing a Compound (or getting its xyz) loops over all of its
+        # particles, so do it once rather than per bead
+        particles = list(self.atomistic.particles())
+        atomistic_xyz = self.atomistic.xyz
+        hmass = element_from_symbol("H").mass
         for key, inds in self.mapping.items():
             name, smarts = key.split("...")
             for group in inds:
-                masses = np.array([self.atomistic[i].mass for i in group])
+                masses = np.array([particles[i].mass for i in group])
                 tot_mass = sum(masses)
-                bead_xyz = self.atomistic.xyz[group, :]
+                bead_xyz = atomistic_xyz[group, :]
                 avg_xyz = np.mean(bead_xyz, axis=0)
                 orientation = None
                 if self.aniso_beads:
                     # filter out hydrogens
-                    hmass = element_from_symbol("H").mass
                     heavy_positions = bead_xyz[np.where(masses > hmass)]
                     if len(heavy_positions) > 2:
                         major_axis, _ = get_major_axis(heavy_positions)
@@ -233,38 +238,51 @@ class CG_Compound(Compound):
             for key, inds in self.mapping.items()
             for group in inds
         ]
+        # Look up the beads containing each atom so each bond only has to be
+        # checked against the beads its atoms belong to
+        atom_beads = defaultdict(list)
+        for k, (_, group) in enumerate(bead_inds):
+            for a in group:
+                atom_beads[a].append(k)
+        bead_bonds = set()
+        for n, (a, b) in enumerate(bonds):
+            for ka in atom_beads[a]:
+                for kb in atom_beads[b]:
+                    if ka != kb:
+                        bead_bonds.add((min(ka, kb), max(ka, kb), n))
+
+        beads = list(self.particles())
         anchors = defaultdict(set)
         bond_map = []
-        for i, (iname, igroup) in enumerate(bead_inds[:-1]):
-            for j, (jname, jgroup) in enumerate(bead_inds[(i + 1) :]):
-                for a, b in bonds:
-                    if a in igroup and b in jgroup:
-                        anchors[iname].add(igroup.index(a))
-                        anchors[jname].add(jgroup.index(b))
-                        bondinfo = (
-                            f"{iname}-{jname}",
-                            (igroup.index(a), jgroup.index(b)),
-                        )
-
-                    elif b in igroup and a in jgroup:
-                        anchors[iname].add(igroup.index(b))
-                        anchors[jname].add(jgroup.index(a))
-                        bondinfo = (
-                            f"{iname}-{jname}",
-                            (igroup.index(b), jgroup.index(a)),
-                        )
-                    else:
-                        continue
-                    if bondinfo not in bond_map:
-                        # If the bond is between two beads of the same type,
-                        # add it to the end
-                        if iname == jname:
-                            bond_map.append(bondinfo)
-                        # Otherwise add it to the beginning
-                        else:
-                            bond_map.insert(0, bondinfo)
-
-                    self.add_bond([self[i], self[j + i + 1]])
+        # Sorting keeps the order of the pairwise bead search
+        for i, j, n in sorted(bead_bonds):
+            iname, igroup = bead_inds[i]
+            jname, jgroup = bead_inds[j]
+            a, b = bonds[n]
+            if a in igroup and b in jgroup:
+                anchors[iname].add(igroup.index(a))
+                anchors[jname].add(jgroup.index(b))
+                bondinfo = (
+                    f"{iname}-{jname}",
+                    (igroup.index(a), jgroup.index(b)),
+                )
+            else:
+                anchors[iname].add(igroup.index(b))
+                anchors[jname].add(jgroup.index(a))
+                bondinfo = (
+                    f"{iname}-{jname}",
+                    (igroup.index(b), jgroup.index(a)),
+                )
+            if bondinfo not in bond_map:
+                # If the bond is between two beads of the same type,
+                # add it to the end
+                if iname == jname:
+                    bond_map.append(bondinfo)
+                # Otherwise add it to the beginning
+                else:
+                    bond_map.insert(0, bondinfo)
+
+            self.add_bond([beads[i], beads[j]])
         if anchors and bond_map:
             self.anchors = anchors
             self.bond_map = bond_map
@@ -287,7 +305,7 @@ class CG_Compound(Compound):
         if filename is None:
             filename = f"{self.name}_mapping.json"
         with open(filename, "w") as f:
-            json.dump(self.mapping, f)
+            f.write(json.dumps(self.mapping))
         print(f"Mapping saved to {filename}")
         return filename
 
@@ -574,9 +592,10 @@ class CG_System:
             ]
         # Break apart the snapshot into separate molecules
         molecules = snap_molecules(snap)
-        mol_inds = []
-        for i in range(max(molecules) + 1):
-            mol_inds.append(np.where(molecules == i)[0])
+        # Bucket the particle indices by molecule in a single sorting pass
+        # (stable, so each molecule's indices stay in ascending order)
+        mol_order = np.argsort(molecules, kind="stable")
+        mol_inds = np.split(mol_order, np.cumsum(np.bincount(molecules))[:-1])
 
         # If molecule length is different, it will be assumed to be different
         mol_lengths = [len(i) for i in mol_inds]
@@ -608,18 +627,6 @@ class CG_System:
 
     def _set_mapping(self):
         """Scale the mapping from each compound to the entire trajectory."""
-
-        def shift_value(i):
-            n_before, n_bead = order[types[i]]
-            return (
-                n_comps * n_before
-                + (i - n_before)
-                + comp_idx * n_bead
-                + bead_count
-            )
-
-        v_shift = np.vectorize(shift_value)
-
         self.mapping = {}
         all_bonds = []
         bead_count = 0
@@ -644,10 +651,16 @@ class CG_System:
                 order = {
                     i: (types.index(i), types.count(i)) for i in set(types)
                 }
-                comp_bonds = []
-                for comp_idx in range(n_comps):
-                    comp_bonds.append(v_shift(bond_array))
-                all_bonds += comp_bonds
+                n_before = np.array([order[i][0] for i in types])[bond_array]
+                n_bead = np.array([order[i][1] for i in types])[bond_array]
+                comp_idx = np.arange(n_comps)[:, np.newaxis, np.newaxis]
+                comp_bonds = (
+                    n_comps * n_before
+                    + (bond_array - n_before)
+                    + comp_idx * n_bead
+                    + bead_count
+                )
+                all_bonds.append(comp_bonds.reshape(-1, 2))
             bead_count += n_comps * len(types)
 
         if all_bonds:
@@ -663,7 +676,7 @@ class CG_System:
             Filename where the mapping operator will be saved in json format.
         """
         with open(filename, "w") as f:
-            json.dump(self.mapping, f, cls=NumpyEncoder)
+            f.write(json.dumps(self.mapping, cls=NumpyEncoder))
         print(f"Mapping saved to {filename}")
 
     def save(self, cg_gsdfile, start=0, stop=None):
@@ -702,20 +715,35 @@ class CG_System:
         N_bonds = 0
         if self._bond_array is not None:
             N_bonds = self._bond_array.shape[0]
-            for bond in self._bond_array:
-                bond_pair = "-".join(
-                    [
-                        types[int(typeid[int(bond[0])])],
-                        types[int(typeid[int(bond[1])])],
-                    ]
+            # Bin the bonds by the pair of bead types they connect
+            pair_typeids = typeid.astype(int)[self._bond_array.astype(int)]
+            uniq_pairs, first_inds, pair_inds = np.unique(
+                pair_typeids, axis=0, return_index=True, return_inverse=True
+            )
+            # Bond type ids are assigned in order of first appearance
+            bond_type_dict = {}
+            pair_bond_ids = np.empty(len(uniq_pairs), dtype=int)
+            for k in np.argsort(first_inds):
+                i, j = uniq_pairs[k]
+                bond_pair = "-".join([types[i], types[j]])
+                pair_bond_ids[k] = bond_type_dict.setdefault(
+                    bond_pair, len(bond_type_dict)
                 )
-                if bond_pair not in bond_types:
-                    bond_types.append(bond_pair)
-                _id = np.where(np.array(bond_types) == bond_pair)[0]
-                bond_ids.append(_id)
+            bond_types = list(bond_type_dict)
+            bond_ids = pair_bond_ids[pair_inds.reshape(-1)]
         else:
             bond_types = None
 
+        # Flatten the bead indices so per-frame bead positions and masses can
+        # be summed in a single pass
+        bead_inds = [
+            np.asarray(x) for inds in self.mapping.values() for x in inds
+        ]
+        bead_sizes = np.array([len(x) for x in bead_inds])
+        bead_starts = np.concatenate(([0], np.cumsum(bead_sizes)[:-1]))
+        flat_inds = np.concatenate(bead_inds)
+        hmass = element_from_symbol("H").mass
+
         with gsd.hoomd.open(cg_gsdfile, "w") as new, gsd.hoomd.open(
             self.gsdfile, "r"
         ) as old:
@@ -723,36 +751,30 @@ class CG_System:
             # even in edge case where there's only one or two frames
             for s in old[start:stop]:
                 new_snap = gsd.hoomd.Frame()
-                position = []
-                mass = []
                 orientation = [] if self.aniso_beads else None
                 f_box = freud.Box.from_box(s.configuration.box)
                 unwrap_pos = f_box.unwrap(
                     s.particles.position, s.particles.image
                 )
-                for i, inds in enumerate(self.mapping.values()):
-                    position += [np.mean(unwrap_pos[x], axis=0) for x in inds]
-
-                    mass += [
-                        sum(s.particles.mass[x]) * self.mass_scale for x in inds
-                    ]
-                    if self.aniso_beads:
-                        for x in inds:
-                            masses = s.particles.mass[x] * self.mass_scale
-                            hmass = element_from_symbol("H").mass
-                            positions = s.particles.position[x]
-                            heavy_positions = positions[
-                                np.where(masses > hmass)
-                            ]
-                            major_axis, ab_idxs = get_major_axis(
-                                heavy_positions
-                            )
-                            orientation.append(get_quaternion(major_axis))
+                position = (
+                    np.add.reduceat(unwrap_pos[flat_inds], bead_starts)
+                    / bead_sizes[:, np.newaxis]
+                )
+                mass = (
+                    np.add.reduceat(s.particles.mass[flat_inds], bead_starts)
+                    * self.mass_scale
+                )
+                if self.aniso_beads:
+                    for x in bead_inds:
+                        masses = s.particles.mass[x] * self.mass_scale
+                        positions = s.particles.position[x]
+                        heavy_positions = positions[np.where(masses > hmass)]
+                        major_axis, ab_idxs = get_major_axis(heavy_positions)
+                        orientation.append(get_quaternion(major_axis))
 
                 if self.aniso_beads:
                     orientation = np.vstack(orientation)
                     new_snap.particles.orientation = orientation
-                position = np.vstack(position)
                 images = f_box.get_images(position)
                 position = f_box.wrap(position)
 
@@ -6,7 +6,7 @@ from collections import defaultdict
 
 from mbuild import Compound, Particle, load
 
-from grits.utils import align, get_hydrogen, get_index
+from grits.utils import align
 
 
 def backmap(cg_compound):
@@ -37,8 +37,9 @@ def backmap(cg_compound):
             b.translate_to(bead.pos)
             anchors[i] = dict()
             if cg_compound.anchors is not None:
+                b_particles = list(b.particles())
                 for index in cg_compound.anchors[bead.name]:
-                    anchors[i][index] = b[index]
+                    anchors[i][index] = b_particles[index]
             fine_grained.add(b, str(i))
         return fine_grained, anchors
 
@@ -47,31 +48,56 @@ def backmap(cg_compound):
         bonded_atoms = []
         remove_hs = []
         rotated = {k: False for k in anchors.keys()}
+        # Index each bead once instead of searching the compound per bond
+        cg_index = {id(bead): i for i, bead in enumerate(cg_compound)}
+        # Collect the hydrogens bonded to each atom in a single pass over the
+        # bonds, ordered as they appear in the compound
+        fg_index = {id(p): i for i, p in enumerate(fine_grained)}
+        hydrogens = defaultdict(list)
+        for a, b in fine_grained.bonds():
+            if b.name == "H":
+                hydrogens[id(a)].append(b)
+            if a.name == "H":
+                hydrogens[id(b)].append(a)
+        for hs in hydrogens.values():
+            hs.sort(key=lambda h: fg_index[id(h)])
+
+        def first_hydrogen(atom):
+            """Get the first hydrogen attached to atom."""
+            hs = hydrogens.get(id(atom))
+            return hs[0] if hs else None
+
+        # The CG bonds and their names don't change while bonding, so only
+        # gather them once
+        cg_bonds = [
+            (
+                ibead,
+                jbead,
+                f"{ibead.name}-{jbead.name}",
+                f"{jbead.name}-{ibead.name}",
+            )
+            for ibead, jbead in cg_compound.bonds()
+        ]
         for name, inds in cg_compound.bond_map:
-            for ibead, jbead in cg_compound.bonds():
-                names = [ibead.name, jbead.name]
-                if "-".join(names) == name:
+            for ibead, jbead, bondname, revname in cg_bonds:
+                if bondname == name:
                     fi, fj = inds
-                elif "-".join(names[::-1]) == name:
+                elif revname == name:
                     fj, fi = inds
                 else:
                     continue
 
-                i = get_index(cg_compound, ibead)
-                j = get_index(cg_compound, jbead)
-                try:
-                    iatom = anchors[i].pop(fi)
-                except KeyError:
+                i = cg_index[id(ibead)]
+                j = cg_index[id(jbead)]
+                if fi not in anchors[i]:
                     fi = [x for x in inds if x in anchors[i]][0]
-                    iatom = anchors[i].pop(fi)
-                try:
-                    jatom = anchors[j].pop(fj)
-                except KeyError:
+                iatom = anchors[i].pop(fi)
+                if fj not in anchors[j]:
                     fj = [x for x in inds if x in anchors[j]][0]
-                    jatom = anchors[j].pop(fj)
+                jatom = anchors[j].pop(fj)
 
-                hi = get_hydrogen(fine_grained, iatom)
-                hj = get_hydrogen(fine_grained, jatom)
+                hi = first_hydrogen(iatom)
+                hj = first_hydrogen(jatom)
                 # each part can be rotated
                 if not rotated[i]:
                     # rotate
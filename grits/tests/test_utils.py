@@ -7,6 +7,15 @@ def test_num2str():
     assert num2str(0) == "A"
     assert num2str(25) == "Z"
     assert num2str(26) == "AA"
+    assert num2str(701) == "ZZ"
+
+
+def test_has_common_member():
+    from grits.utils import has_common_member
+
+    assert has_common_member({0, 1, 2}, (2, 3)) is True
+    assert has_common_member({0, 1, 2}, (3, 4)) is False
+    assert has_common_member([0, 1], [1]) is True
 
 
 def test_get_hydrogen():
@@ -1,5 +1,6 @@
 """Utility functions for GRiTS."""
 import json
+import math
 import re
 import warnings
 
@@ -11,6 +12,8 @@ from ele import element_from_symbol
 from mbuild.box import Box
 from mbuild.compound import Compound, Particle
 
+_DIGIT_RE = re.compile("[0-9]")
+
 
 class NumpyEncoder(json.JSONEncoder):
     """Serializer for numpy objects."""
@@ -63,9 +66,11 @@ def comp_from_snapshot(snapshot, indices, length_scale=1.0, mass_scale=1.0):
     # GSD and HOOMD snapshots center their boxes on the origin (0,0,0)
     shift = np.array(comp.box.lengths) / 2
     particle_dict = {}
+    # Membership in a numpy array is a linear scan, use a set instead
+    index_set = set(int(i) for i in indices)
     # Add particles
     for i in range(n_atoms):
-        if i in indices:
+        if i in index_set:
             name = snapshot.particles.types[snapshot.particles.typeid[i]]
             xyz = snapshot.particles.position[i] * length_scale + shift
             mass = snapshot.particles.mass[i] * mass_scale
@@ -76,7 +81,7 @@ def comp_from_snapshot(snapshot, indices, length_scale=1.0, mass_scale=1.0):
 
     # Add bonds
     for i, j in snapshot.bonds.group:
-        if i in indices and j in indices:
+        if i in index_set and j in index_set:
             comp.add_bond([particle_dict[i], particle_dict[j]])
     return comp
 
@@ -134,7 +139,8 @@ def align(compound, particle, towards_compound, around=None):
         # this is the vector around which the compound is spun
         around = np.cross(comp_to_part, towards_to_comp)
     # and the angle between the two vectors (in rad)
-    angle = np.arccos(np.dot(comp_to_part, towards_to_comp))
+    # clip to guard against roundoff pushing the cosine outside [-1, 1]
+    angle = np.arccos(np.clip(np.dot(comp_to_part, towards_to_comp), -1, 1))
 
     compound.spin(angle, around)
     return around
@@ -155,10 +161,12 @@ def get_bonds(compound):
     list[tuple(int, int)]
         Sorted list of bonded particle indices
     """
-    particle_list = [p for p in compound]
+    particle_index = {id(p): i for i, p in enumerate(compound)}
     bonds = []
-    for tup in compound.bond_graph.edges():
-        bonds.append(tuple(sorted(map(particle_list.index, tup))))
+    for i, j in compound.bond_graph.edges():
+        bonds.append(
+            tuple(sorted((particle_index[id(i)], particle_index[id(j)])))
+        )
     # This sorting is required for coarse-graining
     bonds.sort(key=lambda tup: (tup[0], tup[1]))
     return bonds
@@ -179,16 +187,12 @@ def get_bonded(compound, particle):
     list[mbuild.Particle]
         The bonded particles.
     """
-
-    def is_particle(i, j):
+    xs = []
+    for i, j in compound.bonds():
         if i is particle:
-            return j
+            xs.append(j)
         elif j is particle:
-            return i
-        else:
-            return False
-
-    xs = [is_particle(i, j) for i, j in compound.bonds() if is_particle(i, j)]
+            xs.append(i)
     # The following logic won't be necessary when bond graph is deterministic
     # https://github.com/mosdef-hub/mbuild/issues/895
     # and instead we can just do:
@@ -268,11 +272,10 @@ def get_major_axis(positions_arr):
     AB_indicies = (None, None)
     for i, x0 in enumerate(positions_arr):
         for j, x1 in enumerate(positions_arr[i + 1 :]):
-            vect = x1 - x0
-            dist = np.linalg.norm(vect)
+            dist = math.dist(x0, x1)
             if dist > max_dist:
                 max_dist = dist
-                major_axis = vect
+                major_axis = x1 - x0
                 # adjust j for loop stride
                 AB_indicies = (i, j + i + 1)
     return major_axis, AB_indicies
@@ -333,7 +336,9 @@ def get_quaternion(n1, n0=np.array([0, 0, 1])):
     V_axis = np.cross(n0, n1)
     theta_numerator = np.dot(n0, n1)
     theta_denominator = np.linalg.norm(n0) * np.linalg.norm(n1)
-    theta_rotation = np.arccos(theta_numerator / theta_denominator)
+    theta_rotation = np.arccos(
+        np.clip(theta_numerator / theta_denominator, -1, 1)
+    )
     quaternion = rowan.from_axis_angle(V_axis, theta_rotation)
     return quaternion
 
@@ -370,7 +375,7 @@ def has_number(string):
     bool
         Whether the string contains a number.
     """
-    return bool(re.search("[0-9]", string))
+    return _DIGIT_RE.search(string) is not None
 
 
 def has_common_member(it_a, it_b):
@@ -386,7 +391,15 @@ def has_common_member(it_a, it_b):
     bool
         Whether the object share a common member.
     """
-    return set(it_a) & set(it_b)
+    if not isinstance(it_a, (set, frozenset)):
+        it_a = set(it_a)
+    return any(x in it_a for x in it_b)
+
+
+_NUM2STR = [
+    chr(num + 65) if num < 26 else chr(num // 26 + 64) + chr(num % 26 + 65)
+    for num in range(702)
+]
 
 
 def num2str(num):
@@ -405,7 +418,7 @@ def num2str(num):
     'A'
     >>> num2str(25)
     'Z'
-    >>> num2str(25)
+    >>> num2str(26)
     'AA'
 
     Returns
@@ -413,9 +426,7 @@ def num2str(num):
     str
         The string conversion of the number
     """
-    if num < 26:
-        return chr(num + 65)
-    return "".join([chr(num // 26 + 64), chr(num % 26 + 65)])
+    return _NUM2STR[num]
 
 
 amber_dict = {